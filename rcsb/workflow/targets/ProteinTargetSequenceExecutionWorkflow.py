@@ -32,6 +32,7 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(mo
 logger = logging.getLogger()
 
 HERE = os.path.abspath(os.path.dirname(__file__))
+RSS_UNIT = "MB" if platform.system() == "Darwin" else "GB"
 
 
 class ProteinTargetSequenceExecutionWorkflow(object):
@@ -64,9 +65,8 @@ class ProteinTargetSequenceExecutionWorkflow(object):
         #
 
     def resourceCheck(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
         rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
+        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, RSS_UNIT)
         endTime = time.time()
         logger.info("Completed at %s (%.4f seconds)\n", time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
 
@@ -28,6 +28,7 @@ from rcsb.workflow.chem.ChemCompFileWorkflow import ChemCompFileWorkflow
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+RSS_UNIT = "MB" if platform.system() == "Darwin" else "GB"
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -35,17 +36,16 @@ logger = logging.getLogger()
 
 class ChemCompFileWorkflowTests(unittest.TestCase):
     def setUp(self):
-        self.__startTime = time.time()
+        self.__startTime = time.perf_counter()
         self.__cachePath = os.path.join(HERE, "test-data")
         self.__workPath = os.path.join(HERE, "test-output")
         logger.debug("Running tests on version %s", __version__)
         logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
 
     def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
         rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
+        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, RSS_UNIT)
+        endTime = time.perf_counter()
         logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
 
     def testMakeFiles(self):
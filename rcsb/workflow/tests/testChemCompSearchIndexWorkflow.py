@@ -28,6 +28,7 @@ from rcsb.workflow.chem.ChemCompSearchIndexWorkflow import ChemCompSearchIndexWo
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+RSS_UNIT = "MB" if platform.system() == "Darwin" else "GB"
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -35,7 +36,7 @@ logger = logging.getLogger()
 
 class ChemCompSearchIndexWorkflowTests(unittest.TestCase):
     def setUp(self):
-        self.__startTime = time.time()
+        self.__startTime = time.perf_counter()
         self.__copyPath = os.path.join(HERE, "test-output", "COPY")
         self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
         self.__dataPath = os.path.join(HERE, "test-data")
@@ -43,14 +44,16 @@ class ChemCompSearchIndexWorkflowTests(unittest.TestCase):
         self.__ccUrlTarget = os.path.join(self.__dataPath, "components-abbrev.cif") if abbrevTest else None
         self.__birdUrlTarget = os.path.join(self.__dataPath, "prdcc-abbrev.cif") if abbrevTest else None
         self.__ccFileNamePrefix = "cc-abbrev" if abbrevTest else "cc-full"
+        # Index generation process count (default: available CPUs capped at 6, override with RCSB_TEST_NUMPROC)
+        availCpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        self.__numProc = int(os.environ.get("RCSB_TEST_NUMPROC", min(availCpus, 6)))
         logger.debug("Running tests on version %s", __version__)
         logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
 
     def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
         rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
+        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, RSS_UNIT)
+        endTime = time.perf_counter()
         logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
 
     def testMakeAndStashIndices(self):
@@ -62,7 +65,7 @@ class ChemCompSearchIndexWorkflowTests(unittest.TestCase):
         """
         try:
             ccidxWf = ChemCompSearchIndexWorkflow(cachePath=self.__cachePath, ccFileNamePrefix=self.__ccFileNamePrefix)
-            ok = ccidxWf.makeIndices(self.__ccUrlTarget, self.__birdUrlTarget, numProc=4)
+            ok = ccidxWf.makeIndices(self.__ccUrlTarget, self.__birdUrlTarget, numProc=self.__numProc)
             self.assertTrue(ok)
             ok = ccidxWf.stashIndices(None, self.__copyPath, bundleLabel="A", userName=None, pw=None)
             self.assertTrue(ok)
@@ -20,6 +20,7 @@ import platform
 import resource
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from rcsb.workflow.targets.ProteinTargetSequenceWorkflow import ProteinTargetSequenceWorkflow
 from rcsb.utils.config.ConfigUtil import ConfigUtil
@@ -31,57 +32,57 @@ logger = logging.getLogger()
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+RSS_UNIT = "MB" if platform.system() == "Darwin" else "GB"
 
 
 class ProteinTargetSequenceWorkflowTests(unittest.TestCase):
     skipFull = True
 
-    def setUp(self):
-        self.__isMac = platform.system() == "Darwin"
-        self.__mockTopPath = os.path.join(TOPDIR, "rcsb", "mock-data")
+    @classmethod
+    def setUpClass(cls):
+        cls.__isMac = platform.system() == "Darwin"
+        cls.__mockTopPath = os.path.join(TOPDIR, "rcsb", "mock-data")
         configPath = os.path.join(TOPDIR, "rcsb", "mock-data", "config", "dbload-setup-example.yml")
         configName = "site_info_configuration"
-        self.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName, mockTopPath=self.__mockTopPath)
-        self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
+        cls.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName, mockTopPath=cls.__mockTopPath)
+        cls.__cachePath = os.path.join(HERE, "test-output", "CACHE")
         #
-        self.__workflowFixture()
-        self.__startTime = time.time()
+        if not cls.__workflowFixture():
+            raise RuntimeError("protein target fixture setup failed")
+
+    def setUp(self):
+        self.__startTime = time.perf_counter()
         logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
 
     def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
         rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
+        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, RSS_UNIT)
+        endTime = time.perf_counter()
         logger.info("Completed %s at %s (%.4f seconds)\n", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
 
-    def __workflowFixture(self):
+    @classmethod
+    def __workflowFixture(cls):
         try:
             ok = False
             fU = FileUtil()
             dataPath = os.path.join(HERE, "test-data")
             srcPath = os.path.join(dataPath, "Pharos")
-            dstPath = os.path.join(self.__cachePath, "Pharos-targets")
-            for fn in ["drug_activity", "cmpd_activity", "target", "protein", "t2tc"]:
-                inpPath = os.path.join(srcPath, fn + ".tdd.gz")
-                outPath = os.path.join(dstPath, fn + ".tdd.gz")
-                fU.get(inpPath, outPath)
-                fU.uncompress(outPath, outputDir=dstPath)
-                fU.remove(outPath)
-            #
-            fU.put(os.path.join(srcPath, "pharos-readme.txt"), os.path.join(dstPath, "pharos-readme.txt"))
-            #
-            fastaPath = os.path.join(self.__cachePath, "FASTA")
-            outPath = os.path.join(fastaPath, "pdbprent-targets.fa.gz")
-            fU.mkdir(fastaPath)
-            fU.put(os.path.join(dataPath, "pdbprent-targets.fa.gz"), outPath)
-            fU.uncompress(outPath, outputDir=fastaPath)
+            dstPath = os.path.join(cls.__cachePath, "Pharos-targets")
+            fastaPath = os.path.join(cls.__cachePath, "FASTA")
+            crPath = os.path.join(cls.__cachePath, "chemref-mapping")
+            for dirPath in [dstPath, fastaPath, crPath]:
+                fU.mkdir(dirPath)
             #
-            crPath = os.path.join(self.__cachePath, "chemref-mapping")
-            outPath = os.path.join(crPath, "chemref-mapping-data.json")
-            fU.mkdir(crPath)
-            fU.put(os.path.join(dataPath, "chemref-mapping-data.json"), outPath)
-            ok = True
+            # The fixture transfers are independent, so run them concurrently (decompressing directly from test-data)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futureList = []
+                for fn in ["drug_activity", "cmpd_activity", "target", "protein", "t2tc"]:
+                    futureList.append(executor.submit(fU.uncompress, os.path.join(srcPath, fn + ".tdd.gz"), outputDir=dstPath))
+                futureList.append(executor.submit(fU.put, os.path.join(srcPath, "pharos-readme.txt"), os.path.join(dstPath, "pharos-readme.txt")))
+                futureList.append(executor.submit(fU.uncompress, os.path.join(dataPath, "pdbprent-targets.fa.gz"), outputDir=fastaPath))
+                futureList.append(executor.submit(fU.put, os.path.join(dataPath, "chemref-mapping-data.json"), os.path.join(crPath, "chemref-mapping-data.json")))
+                # FileUtil reports failures through its return values rather than by raising
+                ok = all(future.result() for future in futureList)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
             ok = False